@@ -4,21 +4,44 @@ and plays Juna by Clairo on Spotify while displaying "PERFORMATIVE"
 """
 import cv2
 import mediapipe as mp
+from mediapipe.framework.formats import landmark_pb2
 import numpy as np
 from spotify_controller import SpotifyController
 import time
 import subprocess
+import math
+import os
+import sys
+import threading
+import queue
+import functools
+
+BaseOptions = mp.tasks.BaseOptions
+HandLandmarker = mp.tasks.vision.HandLandmarker
+HandLandmarkerOptions = mp.tasks.vision.HandLandmarkerOptions
+VisionRunningMode = mp.tasks.vision.RunningMode
+
+MODEL_URL = 'https://storage.googleapis.com/mediapipe-models/hand_landmarker/hand_landmarker/float16/1/hand_landmarker.task'
+MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hand_landmarker.task')
+
+@functools.lru_cache(maxsize=64)
+def _text_size(text, scale, thickness):
+    """Cached cv2.getTextSize for FONT_HERSHEY_SIMPLEX - labels and sizes are constant"""
+    return cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness)[0]
 
 class PerformativeDetector:
     def __init__(self):
-        # Initialize MediaPipe Hands
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=2,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.3
-        )
+        # Initialize MediaPipe Hand Landmarker (results arrive via _on_result)
+        if not os.path.exists(MODEL_PATH):
+            print(f"⚠️  Hand landmark model not found: {MODEL_PATH}")
+            print("   Download it with:")
+            print(f"   curl -o {MODEL_PATH} {MODEL_URL}")
+            sys.exit(1)
+        self._latest_result = None
+        self._result_lock = threading.Lock()
+        self._last_timestamp_ms = -1
+        self.hands = self._create_hand_landmarker()
+        self.mp_hands = mp.solutions.hands  # For HAND_CONNECTIONS when drawing
         self.mp_draw = mp.solutions.drawing_utils
         
         # Initialize Spotify controller
@@ -28,23 +51,100 @@ class PerformativeDetector:
         self.is_holding = False
         self.holding_start_time = None
         self.holding_duration_threshold = 0.2  # seconds to confirm holding (smooth)
+        self.not_holding_start_time = None
+        self.release_duration_threshold = 1.0  # seconds without hands before leaving (no flicker)
         self.spotify_mode = False  # Track if we're in Spotify display mode
         self.spotify_mode_start_time = None  # Track when Spotify mode started
         self.face_cam_delay = 1.0  # Wait 1 second before showing face cam
         self.face_cam_shown = False  # Track if face cam has been shown
-        self.force_top_counter = 0  # Counter to periodically force window to top
+        self._prev_spotify_mode = False  # Windows are only destroyed on mode transitions
+        self.force_top_interval = 5.0  # Re-raise Face Cam at most every 5 seconds
+        self._last_force_top = float('-inf')
+        self.force_top_event = threading.Event()  # Wakes the AppleScript thread
+        
+        # Detection cadence - only run MediaPipe every (skip_frames + 1) frames
+        self.frame_idx = 0
+        self.skip_frames = 0  # Adapts to whether hands were found last time
+        self.detection_width = 320  # Hands run on a downscaled copy (landmarks are normalized)
+        self.detection_size = None  # (width, height) - height follows the camera's aspect ratio
+        # Detection copy buffers - the only traffic besides the full frame's decode, flip and display
+        self._small_bgr_buf = None
+        self._rgb_small_buf = None
+        
+        # Pipeline - capture and detection threads feed the display loop via size-1 queues
+        self.frame_queue = queue.Queue(maxsize=1)
+        self.result_queue = queue.Queue(maxsize=1)
+        self.stop_event = threading.Event()
+        self.render_timeout = 0.033  # Max wait for a new frame before pumping HighGUI events
+        
+        # Status canvases never change - render them once up front
+        # Matcha green color (BGR format)
+        self._status_performative = self.create_status_window("PERFORMATIVE", (100, 200, 100))
+        # Bright red color (BGR format) - split into two lines
+        self._status_not_performative = self.create_status_window("NOT\nPERFORMATIVE", (0, 0, 255))
+        
+        # Face cam scratch buffers, reused every frame
+        self._facecam_buf = np.empty((300, 400, 3), np.uint8)
+        self._facecam_label_bg = np.full((61, 400, 3), (40, 50, 30), np.uint8)  # Label band rows 0-60
         
         # Initialize camera
         self.cap = cv2.VideoCapture(0)
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))  # Cheapest decode path
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
         
         print("🎥 Performative Detector Started!")
-        print(f"🎵 Spotify: {'Connected' if self.spotify.is_spotify_available() else 'Disabled'}")
+        print(f"🎵 Spotify: {'Connecting...' if not self.spotify.is_ready() else 'Connected' if self.spotify.is_spotify_available() else 'Disabled'}")
         print("📋 Instructions:")
         print("   - Hold a cup/matcha in front of camera to be PERFORMATIVE")
         print("   - Press 'q' to quit")
     
+    def _create_hand_landmarker(self):
+        """Create a LIVE_STREAM HandLandmarker that tracks hands between frames"""
+        options = HandLandmarkerOptions(
+            base_options=BaseOptions(model_asset_path=MODEL_PATH),
+            running_mode=VisionRunningMode.LIVE_STREAM,
+            num_hands=2,
+            min_hand_detection_confidence=0.5,
+            min_tracking_confidence=0.3,
+            result_callback=self._on_result
+        )
+        return HandLandmarker.create_from_options(options)
+    
+    def _on_result(self, result, output_image, timestamp_ms):
+        """Store the latest landmarker result - called from MediaPipe's thread, so keep it tiny"""
+        with self._result_lock:
+            self._latest_result = result
+    
+    def _next_timestamp_ms(self):
+        """Timestamps passed to detect_async must be strictly increasing"""
+        timestamp_ms = max(int(time.monotonic() * 1000), self._last_timestamp_ms + 1)
+        self._last_timestamp_ms = timestamp_ms
+        return timestamp_ms
+    
+    def _ensure_detection_buffers(self, frame):
+        """Size the detection copy from the actual frame so hands aren't squashed (e.g. 640x480 cameras)"""
+        height, width = frame.shape[:2]
+        detection_height = round(self.detection_width * height / width)
+        if self.detection_size != (self.detection_width, detection_height):
+            self.detection_size = (self.detection_width, detection_height)
+            self._small_bgr_buf = np.empty((detection_height, self.detection_width, 3), np.uint8)
+            self._rgb_small_buf = np.empty_like(self._small_bgr_buf)
+    
+    def landmarks_to_array(self, hand_landmarks):
+        """Read a hand's 21 normalized landmarks into a (21, 2) float32 array of (x, y)"""
+        return np.fromiter(
+            (c for lm in hand_landmarks for c in (lm.x, lm.y)), dtype=np.float32, count=42
+        ).reshape(21, 2)
+    
+    def landmarks_to_proto(self, hand_landmarks):
+        """Convert Tasks API landmarks to the proto that drawing_utils expects"""
+        proto = landmark_pb2.NormalizedLandmarkList()
+        proto.landmark.extend(
+            landmark_pb2.NormalizedLandmark(x=lm.x, y=lm.y, z=lm.z) for lm in hand_landmarks
+        )
+        return proto
+    
     def detect_holding_gesture(self, hand_landmarks_list, image_shape):
         """
         Detect if hands are in a 'holding' position
@@ -61,19 +161,19 @@ class PerformativeDetector:
         # Get center points of both hands
         hand_centers = []
         for hand_landmarks in hand_landmarks_list:
-            # Calculate center of hand (average of all landmarks)
-            x_coords = [lm.x for lm in hand_landmarks.landmark]
-            y_coords = [lm.y for lm in hand_landmarks.landmark]
-            center_x = np.mean(x_coords)
-            center_y = np.mean(y_coords)
+            # Palm center: midpoint of wrist (0) and middle finger MCP (9)
+            wrist = hand_landmarks[0]
+            middle_mcp = hand_landmarks[9]
+            center_x = (wrist.x + middle_mcp.x) * 0.5
+            center_y = (wrist.y + middle_mcp.y) * 0.5
             hand_centers.append((center_x, center_y))
         
         if len(hand_centers) < 2:
             return False
         
         # Calculate distance between hands
-        dist = np.sqrt((hand_centers[0][0] - hand_centers[1][0])**2 + 
-                      (hand_centers[0][1] - hand_centers[1][1])**2)
+        dist = math.hypot(hand_centers[0][0] - hand_centers[1][0],
+                          hand_centers[0][1] - hand_centers[1][1])
         
         # Check if hands are close together (holding something)
         # Made more lenient - increased from 0.3 to 0.5
@@ -94,28 +194,19 @@ class PerformativeDetector:
         Detect if a single hand is in a holding position
         (fingers partially closed, as if gripping something)
         """
-        # Get key landmarks
-        wrist = hand_landmarks.landmark[0]
-        thumb_tip = hand_landmarks.landmark[4]
-        index_tip = hand_landmarks.landmark[8]
-        middle_tip = hand_landmarks.landmark[12]
-        ring_tip = hand_landmarks.landmark[16]
-        pinky_tip = hand_landmarks.landmark[20]
-        
-        # Get MCP (knuckle) points
-        index_mcp = hand_landmarks.landmark[5]
-        middle_mcp = hand_landmarks.landmark[9]
-        
-        # Calculate if fingers are curled (holding position)
+        # Read all 21 landmarks once as a (21, 2) array of (x, y)
+        pts = self.landmarks_to_array(hand_landmarks)
+        
+        # Key landmarks: 0 wrist, 4 thumb tip, 8/12 index/middle tips, 5/9 index/middle MCP (knuckles)
         # Fingers are curled if fingertips are below or close to MCP joints
-        index_curled = index_tip.y > index_mcp.y - 0.08
-        middle_curled = middle_tip.y > middle_mcp.y - 0.08
+        index_curled = pts[8, 1] > pts[5, 1] - 0.08
+        middle_curled = pts[12, 1] > pts[9, 1] - 0.08
         
         # Thumb should be somewhat opposed - made more lenient
-        thumb_dist = np.sqrt((thumb_tip.x - index_tip.x)**2 + (thumb_tip.y - index_tip.y)**2)
+        thumb_dist = math.hypot(pts[4, 0] - pts[8, 0], pts[4, 1] - pts[8, 1])
         
         # Check if hand is in center region and fingers show holding gesture - more lenient area
-        if 0.1 < wrist.x < 0.9 and 0.1 < wrist.y < 0.95:
+        if 0.1 < pts[0, 0] < 0.9 and 0.1 < pts[0, 1] < 0.95:
             if (index_curled or middle_curled) and thumb_dist < 0.3:
                 print(f"👋 Single hand holding detected!")
                 return True
@@ -148,7 +239,7 @@ class PerformativeDetector:
         line_heights = []
         line_widths = []
         for line in lines:
-            text_size = cv2.getTextSize(line, font, scale, thickness)[0]
+            text_size = _text_size(line, scale, thickness)
             line_widths.append(text_size[0])
             line_heights.append(text_size[1])
         
@@ -179,7 +270,7 @@ class PerformativeDetector:
         # Resize frame to smaller size for PIP (picture-in-picture)
         small_height = 300
         small_width = 400
-        small_frame = cv2.resize(frame, (small_width, small_height))
+        small_frame = cv2.resize(frame, (small_width, small_height), dst=self._facecam_buf)
         
         # Add hardcoded "performative" label at the top
         font = cv2.FONT_HERSHEY_SIMPLEX
@@ -188,14 +279,13 @@ class PerformativeDetector:
         thickness = 3
         
         # Get text size for centering
-        text_size = cv2.getTextSize(label, font, scale, thickness)[0]
+        text_size = _text_size(label, scale, thickness)
         text_x = (small_width - text_size[0]) // 2
         text_y = 40
         
-        # Draw semi-transparent background for label
-        overlay = small_frame.copy()
-        cv2.rectangle(overlay, (0, 0), (small_width, 60), (40, 50, 30), -1)
-        cv2.addWeighted(overlay, 0.7, small_frame, 0.3, 0, small_frame)
+        # Blend semi-transparent background for label in place (only the label band)
+        band = small_frame[:self._facecam_label_bg.shape[0]]
+        cv2.addWeighted(self._facecam_label_bg, 0.7, band, 0.3, 0, dst=band)
         
         # Draw text with outline
         cv2.putText(small_frame, label, (text_x, text_y), font, scale, (0, 0, 0), thickness + 2)
@@ -235,6 +325,14 @@ class PerformativeDetector:
         except Exception as e:
             pass  # Silently fail if AppleScript doesn't work
     
+    def force_top_loop(self):
+        """AppleScript thread - a slow osascript fork never stalls the render loop"""
+        while not self.stop_event.is_set():
+            if not self.force_top_event.wait(timeout=0.5):
+                continue
+            self.force_top_event.clear()
+            self.force_face_cam_to_top()
+    
     def draw_status(self, frame, num_hands):
         """Draw status information at bottom of frame"""
         font = cv2.FONT_HERSHEY_SIMPLEX
@@ -243,90 +341,138 @@ class PerformativeDetector:
         cv2.putText(frame, "Press 'q' to quit", 
                    (10, frame.shape[0] - 20), font, 0.6, (200, 200, 200), 1)
     
-    def run(self):
-        """Main detection loop"""
-        while self.cap.isOpened():
-            ret, frame = self.cap.read()
+    def put_latest(self, q, item):
+        """Put item on a size-1 queue, dropping the stale item so consumers see the newest"""
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            pass
+        q.put(item)
+    
+    def capture_loop(self):
+        """Capture thread - grab frames and hand the newest one to the detection thread"""
+        while self.cap.isOpened() and not self.stop_event.is_set():
+            # Grab first, then decode only the frame we actually use
+            if not self.cap.grab():
+                print("Failed to grab frame")
+                break
+            
+            # Detection hasn't taken the last frame yet - drop this one without decoding it
+            if self.frame_queue.full():
+                continue
+            
+            ret, frame = self.cap.retrieve()
             if not ret:
                 print("Failed to grab frame")
                 break
+            self.put_latest(self.frame_queue, frame)
+        self.stop_event.set()
+    
+    def detection_loop(self):
+        """Detection thread - feed the landmarker and pass (frame, landmarks) to the display"""
+        while not self.stop_event.is_set():
+            try:
+                frame = self.frame_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
             
-            # Flip frame horizontally for mirror view
-            frame = cv2.flip(frame, 1)
+            # Flip frame horizontally for mirror view (in place - each retrieved frame is a fresh array)
+            cv2.flip(frame, 1, dst=frame)
             
-            # Convert to RGB for MediaPipe
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # Push to the Hand Landmarker (skip frames once hands are confirmed)
+            if self.frame_idx % (self.skip_frames + 1) == 0:
+                # Downscale and convert to RGB for MediaPipe
+                self._ensure_detection_buffers(frame)
+                small = cv2.resize(frame, self.detection_size, dst=self._small_bgr_buf,
+                                   interpolation=cv2.INTER_AREA)
+                # mp.Image copies the pixels, so the RGB buffer is safe to reuse
+                rgb_small = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self._rgb_small_buf)
+                mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_small)
+                # detect_async only enqueues the image - inference runs on MediaPipe's own C++
+                # graph threads without the GIL, so capture and rendering keep running meanwhile
+                self.hands.detect_async(mp_image, self._next_timestamp_ms())
+            self.frame_idx += 1
             
-            # Process with MediaPipe Hands
-            results = self.hands.process(rgb_frame)
+            # Reuse the most recent result - the landmarker never blocks this loop
+            with self._result_lock:
+                results = self._latest_result
+            hand_landmarks_list = results.hand_landmarks if results else []
             
-            # Check for holding gesture
-            holding_detected = False
-            num_hands = 0
+            # Bigger skip when a hand was already found, so state is sticky
+            self.skip_frames = 0 if not hand_landmarks_list else 4
             
-            if results.multi_hand_landmarks:
-                hand_landmarks_list = results.multi_hand_landmarks
-                num_hands = len(hand_landmarks_list)
-                
-                # Draw hand landmarks
+            self.put_latest(self.result_queue, (frame, hand_landmarks_list))
+    
+    def render_frame(self, frame, hand_landmarks_list):
+        """Update holding state and draw all windows for one detected frame"""
+        # Check for holding gesture
+        holding_detected = False
+        num_hands = 0
+        
+        if hand_landmarks_list:
+            num_hands = len(hand_landmarks_list)
+            
+            # Draw hand landmarks - only visible in the full camera feed, not the small face cam
+            if not self.face_cam_shown:
                 for hand_landmarks in hand_landmarks_list:
                     self.mp_draw.draw_landmarks(
-                        frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS
+                        frame, self.landmarks_to_proto(hand_landmarks), self.mp_hands.HAND_CONNECTIONS
                     )
-                
-                # Simplified: Any hands detected = PERFORMATIVE!
-                holding_detected = True
             
-            # Update holding state with debouncing
-            current_time = time.time()
-            
-            if holding_detected:
-                if self.holding_start_time is None:
-                    self.holding_start_time = current_time
-                elif current_time - self.holding_start_time > self.holding_duration_threshold:
-                    if not self.is_holding:
-                        self.is_holding = True
-                        self.spotify_mode = True  # Enter Spotify mode
-                        self.spotify_mode_start_time = current_time  # Record when we entered Spotify mode
-                        print("✨ PERFORMATIVE DETECTED!")
-                        if self.spotify.is_spotify_available():
-                            self.spotify.play_juna()
-            else:
-                self.holding_start_time = None
-                if self.is_holding:
+            # Simplified: Any hands detected = PERFORMATIVE!
+            holding_detected = True
+        
+        # Update holding state with debouncing
+        current_time = time.time()
+        
+        if holding_detected:
+            self.not_holding_start_time = None
+            if self.holding_start_time is None:
+                self.holding_start_time = current_time
+            elif current_time - self.holding_start_time > self.holding_duration_threshold:
+                if not self.is_holding:
+                    self.is_holding = True
+                    self.spotify_mode = True  # Enter Spotify mode
+                    self.spotify_mode_start_time = current_time  # Record when we entered Spotify mode
+                    print("✨ PERFORMATIVE DETECTED!")
+                    if self.spotify.is_spotify_available():
+                        self.spotify.play_juna()
+        else:
+            self.holding_start_time = None
+            if self.is_holding:
+                if self.not_holding_start_time is None:
+                    self.not_holding_start_time = current_time
+                elif current_time - self.not_holding_start_time > self.release_duration_threshold:
                     self.is_holding = False
+                    self.spotify_mode = False  # Leave Spotify mode on the same timer
+                    self.spotify_mode_start_time = None
+                    self.not_holding_start_time = None
                     print("😐 Not performative anymore")
                     # Note: We don't pause the song - let it keep playing!
+        
+        # Pick the cached status display
+        if self.is_holding:
+            status_display = self._status_performative
+        else:
+            status_display = self._status_not_performative
+        
+        self.draw_status(frame, num_hands)
+        
+        # Display windows based on mode
+        cv2.imshow('Status', status_display)
+        
+        if self.spotify_mode:
+            # Check if enough time has passed since entering Spotify mode
+            time_in_spotify_mode = current_time - self.spotify_mode_start_time if self.spotify_mode_start_time else 0
             
-            # Create status display window
-            if self.is_holding:
-                # Matcha green color (BGR format)
-                status_display = self.create_status_window("PERFORMATIVE", (100, 200, 100))
-            else:
-                # Bright red color (BGR format) - split into two lines
-                status_display = self.create_status_window("NOT\nPERFORMATIVE", (0, 0, 255))
-            
-            self.draw_status(frame, num_hands)
-            
-            # Display windows based on mode
-            cv2.imshow('Status', status_display)
-            
-            if self.spotify_mode:
-                # Check if enough time has passed since entering Spotify mode
-                time_in_spotify_mode = current_time - self.spotify_mode_start_time if self.spotify_mode_start_time else 0
+            if time_in_spotify_mode >= self.face_cam_delay:
+                # Spotify mode: Show small face cam with label after delay
+                face_cam_overlay = self.create_face_cam_overlay(frame)
                 
-                if time_in_spotify_mode >= self.face_cam_delay:
-                    # Spotify mode: Show small face cam with label after delay
-                    face_cam_overlay = self.create_face_cam_overlay(frame)
-                    
-                    # Create window if first time
-                    if not self.face_cam_shown:
-                        cv2.namedWindow('Face Cam', cv2.WINDOW_NORMAL)
-                        cv2.resizeWindow('Face Cam', 400, 300)
-                        self.face_cam_shown = True
-                        print("📹 Face Cam window created")
-                    
-                    cv2.imshow('Face Cam', face_cam_overlay)
+                # Create window if first time
+                if not self.face_cam_shown:
+                    cv2.namedWindow('Face Cam', cv2.WINDOW_NORMAL)
+                    cv2.resizeWindow('Face Cam', 400, 300)
                     cv2.moveWindow('Face Cam', 100, 100)
                     
                     # Try to set topmost property
@@ -335,28 +481,53 @@ class PerformativeDetector:
                     except:
                         pass
                     
-                    # Force window to top periodically (every 10 frames)
-                    self.force_top_counter += 1
-                    if self.force_top_counter % 10 == 0:
-                        self.force_face_cam_to_top()
+                    self.face_cam_shown = True
+                    self._last_force_top = float('-inf')  # Force to top right away
+                    print("📹 Face Cam window created")
                     
-                    # Destroy the full camera feed window if it exists
-                    try:
-                        cv2.destroyWindow('Camera Feed')
-                    except:
-                        pass
-                else:
-                    # Still showing full camera during delay period
-                    cv2.imshow('Camera Feed', frame)
+                    # Face cam replaces the full camera feed shown during the delay
+                    cv2.destroyWindow('Camera Feed')
+                
+                cv2.imshow('Face Cam', face_cam_overlay)
+                
+                # Force window to top periodically, off the render thread
+                now = time.monotonic()
+                if now - self._last_force_top > self.force_top_interval:
+                    self._last_force_top = now
+                    self.force_top_event.set()
             else:
-                # Normal mode: Show full camera feed
+                # Still showing full camera during delay period
                 cv2.imshow('Camera Feed', frame)
-                
-                # Destroy the face cam window if it exists
-                try:
-                    cv2.destroyWindow('Face Cam')
-                except:
-                    pass
+        else:
+            # Normal mode: Show full camera feed
+            cv2.imshow('Camera Feed', frame)
+        
+        # Leaving Spotify mode - drop the face cam window once
+        if self.spotify_mode != self._prev_spotify_mode:
+            if not self.spotify_mode and self.face_cam_shown:
+                cv2.destroyWindow('Face Cam')
+                self.face_cam_shown = False
+            self._prev_spotify_mode = self.spotify_mode
+    
+    def run(self):
+        """Main loop - OpenCV HighGUI has to stay on the main thread (macOS)"""
+        workers = [
+            threading.Thread(target=self.capture_loop, daemon=True),
+            threading.Thread(target=self.detection_loop, daemon=True),
+            threading.Thread(target=self.force_top_loop, daemon=True),
+        ]
+        for worker in workers:
+            worker.start()
+        
+        while not self.stop_event.is_set():
+            # Sleep until the next frame (~30 FPS) instead of spinning; only pump keys if none arrives
+            try:
+                frame, hand_landmarks_list = self.result_queue.get(timeout=self.render_timeout)
+            except queue.Empty:
+                frame = None
+            
+            if frame is not None:
+                self.render_frame(frame, hand_landmarks_list)
             
             # Check for quit
             if cv2.waitKey(1) & 0xFF == ord('q'):
@@ -364,6 +535,9 @@ class PerformativeDetector:
                 break
         
         # Cleanup
+        self.stop_event.set()
+        for worker in workers:
+            worker.join(timeout=1.0)
         self.cap.release()
         cv2.destroyAllWindows()
         self.hands.close()
@@ -374,4 +548,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
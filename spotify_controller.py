@@ -6,6 +6,7 @@ from spotipy.oauth2 import SpotifyOAuth
 import os
 import subprocess
 import threading
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -18,7 +19,17 @@ class SpotifyController:
         self.current_track_uri = None
         self.target_track_uri = "spotify:track:2mWfVxEo4xZYDaz0v7hYrN"  # Juna by Clairo
         self.window_opened = False  # Track if we've already opened the window
-        self._initialize_spotify()
+        self._ready = threading.Event()  # Set once _initialize_spotify has finished
+        
+        # Short-lived playback cache so rapid toggles don't each hit the Spotify API
+        self._playback_lock = threading.Lock()  # _play_juna_async runs on worker threads
+        self._last_playback_check = None  # (timestamp, current_uri, is_playing)
+        self._last_start_playback = None  # (timestamp, uri)
+        self.playback_check_ttl = 3.0  # seconds to trust a current_playback() result
+        self.start_playback_cooldown = 5.0  # seconds before re-sending start_playback for the same track
+        
+        # Authenticate and find a device in the background so the camera can start right away
+        threading.Thread(target=self._initialize_spotify, daemon=True).start()
     
     def _initialize_spotify(self):
         """Initialize Spotify client with OAuth"""
@@ -53,6 +64,8 @@ class SpotifyController:
         except Exception as e:
             print(f"⚠️  Failed to initialize Spotify: {e}")
             self.sp = None
+        finally:
+            self._ready.set()
     
     def show_spotify_window(self):
         """Show and enlarge Spotify window using AppleScript (macOS only) - non-blocking"""
@@ -89,37 +102,56 @@ class SpotifyController:
     
     def _play_juna_async(self):
         """Internal method to play Juna - runs in background thread"""
-        try:
-            # Check current playback
-            current = self.sp.current_playback()
-            
-            # If already playing the right song, don't restart
-            if current and current.get('item'):
-                current_uri = current['item']['uri']
-                if current_uri == self.target_track_uri and current['is_playing']:
+        with self._playback_lock:
+            try:
+                now = time.monotonic()
+                
+                # Just started this track - skip the round-trips entirely
+                if self._last_start_playback:
+                    started_at, started_uri = self._last_start_playback
+                    if started_uri == self.target_track_uri and now - started_at < self.start_playback_cooldown:
+                        return True
+                
+                # Check current playback (reuse a recent result)
+                if self._last_playback_check and now - self._last_playback_check[0] < self.playback_check_ttl:
+                    _, current_uri, is_playing = self._last_playback_check
+                else:
+                    current = self.sp.current_playback()
+                    current_uri = None
+                    is_playing = False
+                    if current and current.get('item'):
+                        current_uri = current['item']['uri']
+                        is_playing = current['is_playing']
+                    self._last_playback_check = (time.monotonic(), current_uri, is_playing)
+                
+                # If already playing the right song, don't restart
+                if current_uri == self.target_track_uri and is_playing:
                     return True
-            
-            # Start playing the track
-            self.sp.start_playback(
-                device_id=self.device_id,
-                uris=[self.target_track_uri]
-            )
-            self.is_playing = True
-            print("🎵 Playing: Juna by Clairo")
-            
-            # Show Spotify window
-            self.show_spotify_window()
-            
-            return True
-            
-        except Exception as e:
-            print(f"⚠️  Failed to play track: {e}")
-            return False
+                
+                # Start playing the track
+                self.sp.start_playback(
+                    device_id=self.device_id,
+                    uris=[self.target_track_uri]
+                )
+                now = time.monotonic()
+                self._last_start_playback = (now, self.target_track_uri)
+                self._last_playback_check = (now, self.target_track_uri, True)
+                self.is_playing = True
+                print("🎵 Playing: Juna by Clairo")
+                
+                # Show Spotify window
+                self.show_spotify_window()
+                
+                return True
+                
+            except Exception as e:
+                print(f"⚠️  Failed to play track: {e}")
+                return False
     
     def play_juna(self):
         """Play 'Juna by Clairo' on Spotify - non-blocking"""
-        if not self.sp:
-            return False
+        if not self._ready.is_set() or not self.sp:
+            return False  # Still warming up or disabled
         
         # Run in background thread to avoid blocking
         thread = threading.Thread(target=self._play_juna_async, daemon=True)
@@ -138,7 +170,11 @@ class SpotifyController:
         except Exception as e:
             print(f"⚠️  Failed to pause: {e}")
     
+    def is_ready(self):
+        """Check if background initialization has finished (successfully or not)"""
+        return self._ready.is_set()
+    
     def is_spotify_available(self):
         """Check if Spotify is available and ready"""
-        return self.sp is not None and self.device_id is not None
+        return self._ready.is_set() and self.sp is not None and self.device_id is not None
 